@@ -1,69 +1,293 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
 import tkinter as tk
+from collections import namedtuple
 from tkinter import messagebox, ttk
 from datetime import datetime, timedelta
-import yfinance as yf
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk # MODIFIED IMPORT: Added NavigationToolbar2Tk
+from functools import lru_cache
+import numpy as np
+from numba import njit, prange
+# yfinance, pandas and matplotlib are imported where they are first needed. They take
+# about a second to load, which would otherwise delay the window on every launch.
+
+# --- 0. Download Cache ---
+
+# Downloaded price frames are pickled here so repeat runs skip the network round-trip.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'normalized-stock-analyzer')
+CACHE_TTL_SECONDS = 3600
+
+# Small in-process memo of normalized results. Unlike the on-disk cache it is keyed on the
+# symbols in the order given, since the result's columns follow that order.
+RESULT_CACHE_SIZE = 32
+_result_cache = {}
+
+def _cache_key(symbols, start_date, end_date, auto_adjust):
+    return (tuple(sorted(symbols)), start_date, end_date, auto_adjust)
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _prune_cache_dir():
+    """Deletes expired entries (and temp files left by interrupted writes) from CACHE_DIR."""
+    now = time.time()
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime >= CACHE_TTL_SECONDS:
+                _remove_quietly(entry.path)
+        except OSError:
+            pass
+
+def _download(symbols, start_date, end_date, auto_adjust=True):
+    """
+    Wraps yf.download with a persistent cache. Entries younger than CACHE_TTL_SECONDS
+    are read back from disk instead of being fetched from Yahoo Finance again.
+    """
+    import pandas as pd
+    import yfinance as yf
+
+    key = _cache_key(symbols, start_date, end_date, auto_adjust)
+    cache_path = os.path.join(CACHE_DIR, hashlib.sha1(repr(key).encode()).hexdigest() + '.pkl')
+
+    try:
+        if time.time() - os.path.getmtime(cache_path) < CACHE_TTL_SECONDS:
+            return pd.read_pickle(cache_path)
+        _remove_quietly(cache_path) # Expired: drop it rather than leave it behind
+    except OSError:
+        pass # Not cached yet (or unreadable), fall through to the network
+    except Exception:
+        # Truncated or corrupt entry: drop it and fetch again
+        _remove_quietly(cache_path)
+
+    data = yf.download(
+        symbols, 
+        start=start_date, 
+        end=end_date, 
+        auto_adjust=auto_adjust, 
+        progress=False
+    )
+
+    # Never cache an empty result, so a transient failure is retried next time
+    if not data.empty:
+        # Write to a temporary file first so an interrupted write never leaves a partial entry behind
+        tmp_path = None
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            _prune_cache_dir()
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+            os.close(fd)
+            data.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best-effort only
+            if tmp_path is not None:
+                _remove_quietly(tmp_path)
+
+    return data
+
+# --- 0b. Normalization Kernel ---
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _normalize(arr, final, out):
+    """
+    Writes arr / final (per column) into out, which may be arr itself, and returns the
+    (min, max) of the result. Each column multiplies by one reciprocal instead of dividing
+    every element, and the min/max are tracked in the same pass rather than a second scan.
+    """
+    col_min = np.empty(arr.shape[1], dtype=np.float64)
+    col_max = np.empty(arr.shape[1], dtype=np.float64)
+    for j in prange(arr.shape[1]):
+        inv = 1.0 / final[j]
+        lo = np.inf
+        hi = -np.inf
+        for i in range(arr.shape[0]):
+            v = arr[i, j] * inv
+            out[i, j] = v
+            lo = min(lo, v)
+            hi = max(hi, v)
+        col_min[j] = lo
+        col_max[j] = hi
+    return col_min.min(), col_max.max()
+
+def _warm_up_kernels():
+    """Compiles (or loads from Numba's on-disk cache) the kernel with a tiny dummy call."""
+    _normalize(np.ones((2, 1), np.float32), np.ones(1, np.float32), np.empty((2, 1), np.float32))
 
 # --- 1. Financial Calculation Function (Same as final version) ---
 
-def calculate_normalized_return(symbols, start_date_str, end_date_str):
+class NormalizedReturns(namedtuple('NormalizedReturns', ['index', 'columns', 'values', 'value_range'])):
     """
-    Calculates the total return series for multiple symbols using the adjusted price,
-    and normalizes the final result so the end value is $1.00.
+    Result of calculate_normalized_return: the shared date index (ndarray), the symbol
+    names (tuple), a (dates x symbols) float32 array of normalized worth, and its (min, max).
+    """
+    __slots__ = ()
+
+    def to_frame(self):
+        """Builds a DataFrame for callers that want one."""
+        import pandas as pd
+        return pd.DataFrame(self.values, index=pd.DatetimeIndex(self.index), columns=list(self.columns))
+
+# Symbols are downloaded (and cached on disk) in batches of this size
+MAX_SYMBOLS_PER_REQUEST = 20
+
+@lru_cache(maxsize=64)
+def _parse_date(date_str):
+    """Validates a YYYY-MM-DD string and returns it as a date. Repeat runs hit the cache."""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f"Invalid date '{date_str}'. Please use the YYYY-MM-DD format.")
+
+def _fetch_price_chunk(chunk, start_date, end_date):
+    """
+    Downloads one batch of symbols with a single yf.download call and returns its adjusted
+    price columns (one column per symbol). Returns an empty frame if nothing was found.
     """
-    
-    # yfinance requires dates in YYYY-MM-DD format
-    start_date = datetime.strptime(start_date_str, '%Y-%m-%d').strftime('%Y-%m-%d')
-    end_date = datetime.strptime(end_date_str, '%Y-%m-%d').strftime('%Y-%m-%d')
-    
     # Fetch Data with Auto-Adjustment (assumes dividends/splits are included)
     try:
-        data = yf.download(
-            symbols, 
-            start=start_date, 
-            end=end_date, 
-            auto_adjust=True, 
-            progress=False
-        )
+        data = _download(chunk, start_date, end_date, auto_adjust=True)
     except Exception as e:
         raise ValueError(f"Error fetching data from Yahoo Finance: {e}")
 
     if data.empty:
-        raise ValueError("No data found for the symbols in the given period. Check dates or symbols.")
+        return data
 
     # Safely Select the Adjusted Price Data
-    if len(symbols) == 1:
+    if len(chunk) == 1:
         # If only one symbol is downloaded, 'Close' is typically the adjusted column
         if 'Close' in data.columns:
-             df_price = data['Close'].to_frame() # Convert Series to DataFrame for consistent logic
+            # Select as a one-column DataFrame (no Series round-trip) and label it with the symbol
+            df_price = data[['Close']]
+            df_price.columns = chunk
         else:
             raise ValueError("Data fetching error: 'Close' column not found.")
     else:
         # For multiple symbols (MultiIndex), try 'Adj Close' then 'Close'
-        if 'Adj Close' in data.columns.get_level_values(0):
+        price_fields = data.columns.get_level_values(0) # Materialized once for both lookups
+        if 'Adj Close' in price_fields:
             df_price = data['Adj Close']
-        elif 'Close' in data.columns.get_level_values(0):
+        elif 'Close' in price_fields:
             df_price = data['Close']
         else:
             raise ValueError("Data fetching error: Cannot find Adjusted or Close price columns.")
-            
-    # Remove rows with any NaN values to ensure proper division later
-    df_price.dropna()
 
-    if df_price.empty:
+    return df_price
+
+def calculate_normalized_return(symbols, start_date_str, end_date_str):
+    """
+    Calculates the total return series for multiple symbols using the adjusted price,
+    and normalizes the final result so the end value is $1.00. Returns a NormalizedReturns.
+    """
+    
+    # yfinance requires dates in YYYY-MM-DD format; validated strings are passed through as-is
+    _parse_date(start_date_str)
+    _parse_date(end_date_str)
+    start_date, end_date = start_date_str, end_date_str
+
+    # Exact repeats skip the download and the normalization entirely
+    key = (tuple(symbols), start_date, end_date, True)
+    cached = _result_cache.get(key)
+    if cached is not None:
+        if time.time() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+        del _result_cache[key] # Expired
+    
+    # Fetch Data in batches of at most MAX_SYMBOLS_PER_REQUEST, one after another: yf.download
+    # keeps its per-call results in module-global state, so concurrent calls corrupt each other.
+    # (Each call still fetches its tickers on yfinance's own threads.)
+    chunks = [symbols[i:i + MAX_SYMBOLS_PER_REQUEST] for i in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST)]
+    frames = [_fetch_price_chunk(chunk, start_date, end_date) for chunk in chunks]
+
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        raise ValueError("No data found for the symbols in the given period. Check dates or symbols.")
+
+    if len(frames) == 1:
+        df_price = frames[0]
+    else:
+        import pandas as pd
+        df_price = pd.concat(frames, axis=1)
+
+    # From here on work on one contiguous (dates x symbols) float32 buffer (plenty of
+    # precision for plotting) plus the shared date index, instead of DataFrames.
+    index = df_price.index.values
+    columns = tuple(df_price.columns)
+    # The copy is forced to C order (pandas hands back F-ordered blocks) so the kernel
+    # always sees the layout _warm_up_kernels compiled, instead of JIT-compiling a second one.
+    values = np.array(df_price.to_numpy(), dtype=np.float32, order='C')
+
+    # Remove rows with any NaN values to ensure proper division later.
+    # One vectorized pass finds them; liquid tickers usually have none, so nothing is copied.
+    nan_rows = np.isnan(values).any(axis=1)
+    if nan_rows.any():
+        index = index[~nan_rows]
+        values = values[~nan_rows]
+
+    if len(values) == 0:
         raise ValueError("No overlapping data found for all symbols after cleaning.")
             
     # --- Normalize the Entire Series (End Value is $1) ---
 
     # Get the LAST (final) price for each stock.
-    final_prices = df_price.iloc[-1]
+    final_prices = values[-1].copy()
     
-    # Divide the entire DataFrame by the final price for each column (vectorized operation).
-    df_normalized_worth = df_price.div(final_prices, axis=1)
+    # Divide every column by its final price in place, without allocating a second buffer.
+    # The kernel also returns the (min, max) of the result, so callers need not rescan it.
+    value_range = _normalize(values, final_prices, values)
+    normalized_worth = NormalizedReturns(index, columns, values, value_range)
 
-    return df_normalized_worth
+    # Remember the result (as the newest entry), evicting the oldest one once the memo is full
+    _result_cache.pop(key, None)
+    if len(_result_cache) >= RESULT_CACHE_SIZE:
+        _result_cache.pop(next(iter(_result_cache)))
+    _result_cache[key] = (time.time(), normalized_worth)
+
+    return normalized_worth
+
+# --- 1b. Plot Helpers ---
+
+def _decimate_min_max(x_values, values, n_buckets):
+    """
+    Reduces a long series to a min/max envelope of n_buckets buckets (two points per
+    bucket) so no more vertices than screen pixels reach the renderer. The rows before the
+    last are spread evenly over the buckets. Each bucket's min and max are emitted in the
+    order they occur, at their own dates, so the shape of the line is kept. Since those
+    dates differ per symbol, the returned x is 2D like the values. The final row is always
+    kept as-is so every line still visibly ends at $1.00. Requires n_buckets < len(values).
+    """
+    n_rows, n_cols = values.shape
+    edges = np.linspace(0, n_rows - 1, n_buckets + 1).astype(np.intp)
+    starts, stops = edges[:-1], edges[1:]
+
+    # Bucket sizes differ by at most one; shorter buckets repeat their last row, which
+    # does not change their min or max, so all buckets can be reduced as one 3D array.
+    width = int((stops - starts).max())
+    row_idx = np.minimum(starts[:, None] + np.arange(width), stops[:, None] - 1)
+    blocks = values[row_idx]
+    i_min = blocks.argmin(axis=1)
+    i_max = blocks.argmax(axis=1)
+
+    rows = np.arange(n_buckets)[:, None]
+    first = row_idx[rows, np.minimum(i_min, i_max)]
+    second = row_idx[rows, np.maximum(i_min, i_max)]
+    picked = np.stack((first, second), axis=1).reshape(2 * n_buckets, n_cols)
+    picked = np.concatenate((picked, np.full((1, n_cols), n_rows - 1)))
+
+    return x_values[picked], values[picked, np.arange(n_cols)]
+
+def _column(x_values, j):
+    """x for the j-th line: shared 1D dates, or that symbol's own column of 2D dates."""
+    return x_values if x_values.ndim == 1 else x_values[:, j]
 
 # --- 2. Tkinter Application Class ---
 
@@ -76,6 +300,12 @@ class StockAnalyzerApp:
         self.end_date_default = datetime.now()
         self.start_date_default = self.end_date_default - timedelta(days=5*365) # Approx 5 years ago
 
+        # Symbols may be separated by commas and/or whitespace
+        self._sym_re = re.compile(r'[,\s]+')
+
+        # Compile the Numba kernel while the user is still looking at the inputs
+        threading.Thread(target=_warm_up_kernels, daemon=True).start()
+
         self.setup_ui()
         self.run_analysis() # Run analysis with defaults on startup
 
@@ -120,8 +350,14 @@ class StockAnalyzerApp:
         plot_frame.columnconfigure(0, weight=1)
         plot_frame.rowconfigure(0, weight=1)
 
-        # Create a figure for the plot
-        self.fig, self.ax = plt.subplots(figsize=(8, 5))
+        # Matplotlib is only loaded once the input widgets exist
+        import matplotlib.dates as mdates
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+        # Create a figure for the plot (directly, since pyplot's global figure manager is not needed when embedding)
+        self.fig = Figure(figsize=(8, 5))
+        self.ax = self.fig.add_subplot()
         
         # Embed the Matplotlib figure into Tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
@@ -136,67 +372,208 @@ class StockAnalyzerApp:
         # FIXED: Use grid for the toolbar and place it below the canvas (row=1)
         self.toolbar.grid(row=1, column=0, sticky=tk.W+tk.E) 
         # -----------------------------
+
+        # Blitting state: the line of each plotted symbol, what they were plotted for, and the cached background
+        self._lines = {}
+        self._plot_key = None
+        self._background = None
+        self._legend_columns = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # The plotted result and its dates as Matplotlib numbers, used to re-decimate on zoom/pan
+        self._result = None
+        self._x_nums = None
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
         
         # Initial plot setup
         self.ax.set_title("Normalized Performance (Initial Run)")
         self.ax.set_xlabel("Date")
         self.ax.set_ylabel("Normalized Asset Worth (End Value = $1.00)")
+        self.ax.grid(True, linestyle='--', alpha=0.7)
+
+        # Format the date axis once here rather than with autofmt_xdate on every run
+        locator = mdates.AutoDateLocator()
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        self.ax.tick_params(axis='x', labelrotation=30)
+        for label in self.ax.get_xticklabels():
+            label.set_ha('right')
         self.fig.tight_layout()
 
     def run_analysis(self):
-        """Fetches data, calculates normalization, and updates the plot."""
+        """Validates the input and starts fetching data in the background."""
+        # 1. Gather and Validate Input
+        symbol_str = self.symbols_var.get().upper()
+        start_date_str = self.start_date_var.get()
+        end_date_str = self.end_date_var.get()
+        
+        symbols_list = [s for s in self._sym_re.split(symbol_str) if s]
+        if not symbols_list:
+            messagebox.showerror("Input Error / Data Fetch Error", "Please enter at least one valid stock symbol.")
+            return
+
+        # Validate the dates up front; the worker's own check then hits the parse cache
+        try:
+            _parse_date(start_date_str)
+            _parse_date(end_date_str)
+        except ValueError as e:
+            messagebox.showerror("Input Error / Data Fetch Error", str(e))
+            return
+
+        self._start_fetch(symbols_list, start_date_str, end_date_str)
+
+    def _start_fetch(self, symbols_list, start_date_str, end_date_str):
+        """Disables the button and runs the download on a worker thread so the UI stays responsive."""
         self.run_button.config(state=tk.DISABLED, text="Loading...")
-        self.root.update()
+        threading.Thread(
+            target=self._fetch_worker,
+            args=(symbols_list, start_date_str, end_date_str),
+            daemon=True
+        ).start()
 
+    def _fetch_worker(self, symbols_list, start_date_str, end_date_str):
+        """
+        Runs off the main thread. Tk and Matplotlib must only be touched from the
+        main thread, so the result (or error) is handed back through root.after.
+        """
         try:
-            # 1. Gather and Validate Input
-            symbol_str = self.symbols_var.get().upper()
-            start_date_str = self.start_date_var.get()
-            end_date_str = self.end_date_var.get()
-            
-            symbols_list = [s.strip() for s in symbol_str.split(',') if s.strip()]
-            if not symbols_list:
-                raise ValueError("Please enter at least one valid stock symbol.")
-            
             # 2. Call the Financial Calculation
-            df_normalized = calculate_normalized_return(symbols_list, start_date_str, end_date_str)
-            
+            result = calculate_normalized_return(symbols_list, start_date_str, end_date_str)
+        except ValueError as e:
+            # Handle specific known errors (e.g., input validation, data not found)
+            self.root.after(0, self._show_error, "Input Error / Data Fetch Error", str(e))
+        except Exception as e:
+            # Handle general unexpected errors (e.g., network issues)
+            self.root.after(0, self._show_error, "Unexpected Error", f"An unexpected error occurred: {e}")
+        else:
+            self.root.after(0, self._apply_result, result, start_date_str, end_date_str)
+
+    def _on_draw(self, event):
+        """
+        Called after every full draw (including toolbar pan/zoom and saving). Caches the
+        static background for blitting, then paints the animated artists that the draw skipped.
+        """
+        if not self.canvas.is_saving():
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._animated_artists():
+            artist.draw(event.renderer)
+
+    def _draw_lines(self):
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+
+    def _animated_artists(self):
+        """The lines, then the legend, so the legend stays on top of them as in a normal draw."""
+        artists = list(self._lines.values())
+        legend = self.ax.get_legend()
+        if legend is not None:
+            artists.append(legend)
+        return artists
+
+    def _line_data(self, start, stop):
+        """
+        Returns the rows [start, stop) of the current result, decimated to a min/max
+        envelope when there are more rows than about one per pixel column of the axes.
+        """
+        x_values = self._result.index[start:stop]
+        values = self._result.values[start:stop]
+        # Two points per bucket, so half as many buckets as pixels; only decimate if that is shorter
+        n_buckets = max(1, int(self.ax.bbox.width) // 2)
+        if len(values) > 2 * n_buckets + 1:
+            x_values, values = _decimate_min_max(x_values, values, n_buckets)
+        return x_values, values
+
+    def _on_xlim_changed(self, ax):
+        """Re-decimates from the full result for the visible range, so zooming in shows the real data."""
+        if self._result is None:
+            return
+        x_min, x_max = ax.get_xlim()
+        # Keep one point beyond each edge so the lines run to the border of the axes
+        start = max(int(np.searchsorted(self._x_nums, x_min, side='left')) - 1, 0)
+        stop = min(int(np.searchsorted(self._x_nums, x_max, side='right')) + 1, len(self._x_nums))
+        x_values, values = self._line_data(start, stop)
+        for j, column in enumerate(self._result.columns):
+            line = self._lines.get(column)
+            if line is not None: # Not yet created while a new result is being applied
+                line.set_data(_column(x_values, j), values[:, j])
+
+    def _show_error(self, title, message):
+        messagebox.showerror(title, message)
+        self.run_button.config(state=tk.NORMAL, text="Run Analysis & Plot")
+
+    def _apply_result(self, result, start_date_str, end_date_str):
+        """Prints the initial values and updates the plot. Runs on the main thread."""
+        try:
             # --- START: New logic to print initial values to console ---
             print("\n--- Initial Normalized Values (Investment Required to reach $1.00 at End) ---")
             
-            # The initial value is the first row (iloc[0]) of the normalized DataFrame
-            initial_values = df_normalized.iloc[0]
-            
-            for symbol, initial_value in initial_values.items():
+            # The initial value is the first row of the normalized values
+            for symbol, initial_value in zip(result.columns, result.values[0]):
                 print(f"{symbol}: ${initial_value:.4f}")
             
             print("----------------------------------------------------------------------------------")
 
             # 3. Update the Plot
-            self.ax.clear()
-            
-            for column in df_normalized.columns:
-                self.ax.plot(df_normalized.index, df_normalized[column], label=column, linewidth=0.5)
+            x_values = result.index
+            values = result.values
 
-            self.ax.set_title(f"Normalized Performance ({start_date_str} to {end_date_str})")
-            self.ax.set_xlabel("Date")
-            self.ax.set_ylabel("Normalized Asset Worth (End Value = $1.00)")
-            self.ax.legend(title='Symbol', loc='upper left')
-            self.ax.grid(True, linestyle='--', alpha=0.7)
-            
             # Ensure Y-axis starts near zero and ends near 1
-            y_min = df_normalized.min().min() * 0.95
-            y_max = df_normalized.max().max() * 1.05
-            self.ax.set_ylim([max(0, y_min), y_max])
+            y_min, y_max = result.value_range
+            y_min *= 0.95
+            y_max *= 1.05
+            y_lim = (max(0, y_min), y_max)
+            plot_key = (result.columns, start_date_str, end_date_str, x_values[0], x_values[-1], y_lim)
+
+            import matplotlib.dates as mdates
+            self._result = result
+            self._x_nums = mdates.date2num(result.index)
+            x_values, values = self._line_data(0, len(result.values))
+
+            # Reuse the existing line of every symbol that is still plotted, drop stale ones,
+            # and create all new ones in a single plot call. The lines are animated so the
+            # cached background never contains them.
+            columns = list(result.columns)
+            for column in [c for c in self._lines if c not in columns]:
+                self._lines.pop(column).remove()
+            new_idx = []
+            for j, column in enumerate(columns):
+                if column in self._lines:
+                    self._lines[column].set_data(_column(x_values, j), values[:, j])
+                else:
+                    new_idx.append(j)
+            if new_idx:
+                new_x = x_values if x_values.ndim == 1 else x_values[:, new_idx]
+                new_lines = self.ax.plot(new_x, values[:, new_idx], linewidth=0.5, animated=True)
+                for j, line in zip(new_idx, new_lines):
+                    self._lines[columns[j]] = line
+
+            # Same symbols, dates and limits: only the line data needs redrawing
+            if plot_key == self._plot_key and self._background is not None:
+                self._on_xlim_changed(self.ax) # The view may be zoomed in, so match its range
+                self.canvas.restore_region(self._background)
+                self._draw_lines()
+                self.canvas.blit(self.ax.bbox)
+                return
+            self._plot_key = plot_key
 
-            self.fig.autofmt_xdate() # Format x-axis dates nicely
-            self.canvas.draw()
+            self.ax.set_title(f"Normalized Performance ({start_date_str} to {end_date_str})")
+            # The legend only depends on the symbols (their lines are reused), so rebuild it only when they change.
+            # It is animated too, so it can be painted above the lines instead of baked into the background.
+            if result.columns != self._legend_columns:
+                legend = self.ax.legend([self._lines[c] for c in columns], columns, title='Symbol', loc='upper left')
+                legend.set_animated(True)
+                self._legend_columns = result.columns
+            # Set both limits explicitly: since the axes are no longer cleared, a toolbar zoom or
+            # pan would otherwise leave x-autoscaling off and keep the old view
+            self.ax.set_xlim(result.index[0], result.index[-1])
+            self.ax.set_ylim(y_lim)
+            self.toolbar.update() # Reset the toolbar's view history so Home returns to this view
+
+            # Coalesce into one Agg render on the next idle cycle; _on_draw then recaptures the background
+            self._background = None
+            self.canvas.draw_idle()
             
-        except ValueError as e:
-            # Handle specific known errors (e.g., input validation, data not found)
-            messagebox.showerror("Input Error / Data Fetch Error", str(e))
         except Exception as e:
-            # Handle general unexpected errors (e.g., network issues)
             messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {e}")
             
         finally: